@@ -47,6 +47,22 @@ class GitResponse(BaseModel):
 
 _agent = None
 
+# Single shared worker for agent.chat — the agent isn't thread-safe, so
+# chat requests serialize through one executor instead of each request
+# spawning (and leaking) its own ThreadPoolExecutor.
+_chat_executor = None
+
+
+def _get_chat_executor():
+    global _chat_executor
+    if _chat_executor is None:
+        from concurrent.futures import ThreadPoolExecutor
+
+        _chat_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="oscar-chat"
+        )
+    return _chat_executor
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -80,10 +96,13 @@ app.add_middleware(
 
 @app.get("/health")
 async def health():
+    import asyncio
     from oscar.tools.git_tool import git_status
 
+    # git_status shells out three times — run it in a worker thread so the
+    # health probe doesn't stall the event loop for other requests.
     try:
-        status = git_status()
+        status = await asyncio.get_event_loop().run_in_executor(None, git_status)
         git_ok = not status.startswith("Error")
     except Exception:
         git_ok = False
@@ -98,14 +117,13 @@ async def health():
 @app.post("/chat", response_model=ChatResponse)
 async def chat(req: ChatRequest):
     import asyncio
-    from concurrent.futures import ThreadPoolExecutor
 
     if _agent is None:
         raise HTTPException(503, "Agent not initialized")
     try:
         loop = asyncio.get_event_loop()
         response = await loop.run_in_executor(
-            ThreadPoolExecutor(max_workers=1), _agent.chat, req.message
+            _get_chat_executor(), _agent.chat, req.message
         )
         return ChatResponse(response=response)
     except Exception as e:
@@ -117,14 +135,12 @@ async def chat_stream(req: ChatRequest):
     """SSE streaming endpoint — sends step-by-step progress events."""
     import asyncio
     import json as _json
-    from concurrent.futures import ThreadPoolExecutor
     from fastapi.responses import StreamingResponse
     from oscar.core.agent import get_last_step
 
     if _agent is None:
         raise HTTPException(503, "Agent not initialized")
 
-    _executor = ThreadPoolExecutor(max_workers=1)
     _result = {"done": False, "response": "", "error": None}
 
     def _run_chat():
@@ -137,7 +153,7 @@ async def chat_stream(req: ChatRequest):
 
     async def _event_generator():
         loop = asyncio.get_event_loop()
-        loop.run_in_executor(_executor, _run_chat)
+        loop.run_in_executor(_get_chat_executor(), _run_chat)
 
         last_sent = {}
         while not _result["done"]:
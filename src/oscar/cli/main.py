@@ -2,37 +2,36 @@
 OSCAR CLI — GitHub-Specialized AI Coding Assistant
 """
 
-import click
 import sys
 import os
-from pathlib import Path
-from rich.console import Console
-from rich.panel import Panel
-from rich.text import Text
-from rich.markdown import Markdown
 
-console = Console()
+# Rich is imported lazily so `oscar --help` / `--config-check` don't pay for
+# Console/Panel/Text machinery before Click has even parsed argv.
+_console = None
 
 
-def display_welcome():
-    """Display welcome message."""
-    welcome_text = Text()
-    welcome_text.append("OSCAR ", style="bold blue")
-    welcome_text.append("— GitHub-Specialized AI Coding Assistant", style="white")
+def _get_console():
+    """Return the shared Rich console, importing Rich on first use."""
+    global _console
+    if _console is None:
+        import rich
+
+        # Reconfigure the process-wide console (shared with the agent and
+        # safety layers) rather than constructing a second instance.
+        # highlight=False: our output is explicitly markup-styled, so
+        # skip Rich's regex-based auto-highlighting pass on every print.
+        rich.reconfigure(highlight=False)
+        _console = rich.get_console()
+    return _console
 
-    panel = Panel(welcome_text, title="Welcome", border_style="blue", padding=(1, 2))
-    console.print(panel)
 
-    config_info = """
+# Static REPL text, built once at import instead of per display call.
+_WELCOME_INFO = """
     [bold]Powered by:[/bold] Asterix + Gemini 2.5 Flash (Vertex AI)
     [dim]Type 'help' for commands or describe what you want to do...[/dim]
     """
-    console.print(config_info)
 
-
-def display_help():
-    """Display available commands."""
-    help_text = """
+_HELP_TEXT = """
     [bold]Commands:[/bold]
     [cyan]help[/cyan] or [cyan]?[/cyan]    Show this help
     [cyan]config[/cyan]       Show configuration
@@ -53,11 +52,42 @@ def display_help():
     [bold]Safety:[/bold] Destructive operations (push, checkout, shell commands)
     require your confirmation before executing.
     """
-    console.print(help_text)
+
+
+# Welcome Panel renderable, built lazily and reused across invocations.
+_welcome_panel = None
+
+
+def display_welcome():
+    """Display welcome message."""
+    global _welcome_panel
+
+    console = _get_console()
+
+    if _welcome_panel is None:
+        from rich.panel import Panel
+        from rich.text import Text
+
+        welcome_text = Text()
+        welcome_text.append("OSCAR ", style="bold blue")
+        welcome_text.append("— GitHub-Specialized AI Coding Assistant", style="white")
+        _welcome_panel = Panel(
+            welcome_text, title="Welcome", border_style="blue", padding=(1, 2)
+        )
+
+    # Single print call — one render/flush for banner plus info text.
+    console.print(_welcome_panel, _WELCOME_INFO)
+
+
+def display_help():
+    """Display available commands."""
+    _get_console().print(_HELP_TEXT)
 
 
 def show_config():
     """Show current configuration."""
+    from pathlib import Path
+
     from oscar.core.agent import get_agent
 
     agent = get_agent()
@@ -75,11 +105,12 @@ def show_config():
     [bold]Directories:[/bold]
     Data: [dim]{Path('./data').resolve()}[/dim]
     """
-    console.print(config_details)
+    _get_console().print(config_details)
 
 
 def test_llm_connection():
     """Test LLM connection via Asterix agent."""
+    console = _get_console()
     console.print("[yellow]Testing Gemini connection via Vertex AI...[/yellow]")
     try:
         from oscar.core.agent import get_agent
@@ -93,14 +124,32 @@ def test_llm_connection():
 
 def process_user_request(user_input: str):
     """Process natural language request through the Asterix agent."""
+    console = _get_console()
     try:
+        from rich.markdown import Markdown
+
         from oscar.core.agent import get_agent
 
+        # Opt-in response cache — answers depend on live repo state, so
+        # only reuse them when the user explicitly asks for it.
+        use_cache = os.getenv("OSCAR_RESPONSE_CACHE", "false").lower() == "true"
+        if use_cache:
+            from oscar.core.cache import response_cache
+
+            cached = response_cache.get(user_input)
+            if cached is not None:
+                console.print()
+                console.print(Markdown(cached))
+                return
+
         agent = get_agent()
 
         with console.status("[bold blue]Thinking...[/bold blue]"):
             response = agent.chat(user_input)
 
+        if use_cache:
+            response_cache.put(user_input, response)
+
         console.print()
         console.print(Markdown(response))
 
@@ -113,6 +162,7 @@ def process_user_request(user_input: str):
 
 def start_api_server():
     """Start the FastAPI server."""
+    console = _get_console()
     try:
         from oscar.api.server import start_server
 
@@ -124,15 +174,26 @@ def start_api_server():
         console.print(f"[red]Server error: {e}[/red]")
 
 
-@click.command()
-@click.option("--debug", is_flag=True, help="Enable debug mode")
-@click.option("--config-check", is_flag=True, help="Check configuration and exit")
-def main(debug, config_check):
-    """OSCAR — GitHub-Specialized AI Coding Assistant"""
+# REPL command dispatch — single dict lookup instead of an if/elif ladder.
+_COMMANDS = {
+    "help": display_help,
+    "?": display_help,
+    "config": show_config,
+    "test": test_llm_connection,
+    "serve": start_api_server,
+}
+
+_EXIT_COMMANDS = frozenset({"quit", "exit"})
+
+
+def _run(debug, config_check):
+    """Run OSCAR with the given flags (shared by both entry paths)."""
 
     if debug:
         os.environ["OSCAR_DEBUG"] = "true"
 
+    console = _get_console()
+
     try:
         if config_check:
             from oscar.core.agent import get_agent
@@ -148,24 +209,23 @@ def main(debug, config_check):
 
         while True:
             try:
-                user_input = console.input("[bold blue]OSCAR>[/bold blue] ").strip()
+                # Plain input() — Console.input re-renders markup and
+                # resets terminal state on every prompt; the hot loop
+                # only needs a static prompt string.
+                user_input = input("OSCAR> ").strip()
 
                 if not user_input:
                     continue
 
-                cmd = user_input.lower()
+                cmd = user_input.casefold()
 
-                if cmd in ("quit", "exit"):
+                if cmd in _EXIT_COMMANDS:
                     console.print("[dim]Goodbye.[/dim]")
                     break
-                elif cmd in ("help", "?"):
-                    display_help()
-                elif cmd == "config":
-                    show_config()
-                elif cmd == "test":
-                    test_llm_connection()
-                elif cmd == "serve":
-                    start_api_server()
+
+                handler = _COMMANDS.get(cmd)
+                if handler is not None:
+                    handler()
                 else:
                     process_user_request(user_input)
 
@@ -183,5 +243,35 @@ def main(debug, config_check):
         sys.exit(1)
 
 
+def _click_main():
+    """Full Click command — only built when --help is requested."""
+    import click
+
+    @click.command()
+    @click.option("--debug", is_flag=True, help="Enable debug mode")
+    @click.option("--config-check", is_flag=True, help="Check configuration and exit")
+    def cli(debug, config_check):
+        """OSCAR — GitHub-Specialized AI Coding Assistant"""
+        _run(debug, config_check)
+
+    cli()
+
+
+def main():
+    """Entry point with a hand-rolled argv fast path.
+
+    Only two flags exist, so the common interactive launch parses them
+    directly and skips importing Click entirely. --help (and any flag we
+    don't recognize) falls back to the Click command for auto-generated
+    help and error messages.
+    """
+    argv = sys.argv[1:]
+    known = {"--debug", "--config-check"}
+    if any(a not in known for a in argv):
+        return _click_main()
+
+    return _run(debug="--debug" in argv, config_check="--config-check" in argv)
+
+
 if __name__ == "__main__":
     main()
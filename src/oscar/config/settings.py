@@ -4,19 +4,59 @@ Simplified configuration loading and validation.
 """
 
 import os
+import re
 import yaml
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any
-from pydantic import BaseModel
+from typing import Dict, Any, Optional
+from pydantic import BaseModel, ConfigDict
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+# Prefer libyaml's C loader — same safe_load semantics, ~10x faster parse.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+
+# Provider → env-var lookup table, built once at import.
+_API_KEY_ENV_VARS = {
+    "groq": "GROQ_API_KEY",
+    "openai": "OPENAI_API_KEY",
+    "gemini": "GEMINI_API_KEY",
+}
+
+
+@lru_cache(maxsize=None)
+def _env_api_key(provider: str, env_var: str) -> str:
+    """Cached env lookup for provider API keys (env is fixed after load_dotenv)."""
+    api_key = os.getenv(env_var)
+    if not api_key:
+        raise ValueError(f"API key not found for {provider}. Please set {env_var} in your .env file")
+    return api_key
+
+
+@lru_cache(maxsize=None)
+def _tavily_keys() -> tuple:
+    """Cached Tavily key tuple, in fallback order."""
+    keys = []
+    for key_name in ["TAVILY_API_KEY1", "TAVILY_API_KEY2"]:
+        key = os.getenv(key_name)
+        if key:
+            keys.append(key)
+    return tuple(keys)
+
 
 class LLMProviderConfig(BaseModel):
     """Configuration for a single LLM provider."""
-    base_url: str = None  # Optional - Gemini doesn't use OpenAI-compatible endpoint
+    # Frozen: config is read-only after load, which lets pydantic skip
+    # mutation bookkeeping; extra='forbid' surfaces YAML typos at load time.
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    base_url: Optional[str] = None  # Optional - Gemini doesn't use OpenAI-compatible endpoint
     model: str
     max_tokens: int = 4096
     temperature: float = 0.1
@@ -25,6 +65,8 @@ class LLMProviderConfig(BaseModel):
 
 class LLMConfig(BaseModel):
     """Complete LLM configuration."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     active_provider: str
     providers: Dict[str, LLMProviderConfig]
     system_prompt: str
@@ -42,21 +84,38 @@ class OSCARSettings:
         
         # Ensure data directories exist
         self._create_data_dirs()
-        
-        # Load LLM configuration
-        self.llm_config = self._load_llm_config()
+
+        # LLM configuration is loaded lazily — fast CLI paths (--help,
+        # --config-check) never touch the YAML parse + pydantic validation.
+        self._llm_config = None
     
     def _create_data_dirs(self):
-        """Create required data directories."""
-        for subdir in ["models", "memory", "logs", "downloads"]:
+        """Create required data directories.
+
+        One os.scandir of the data dir replaces a stat per subdirectory;
+        mkdir only runs for subdirs that are actually missing.
+        """
+        required = {"models", "memory", "logs", "downloads"}
+        try:
+            existing = {e.name for e in os.scandir(self.data_dir) if e.is_dir()}
+        except FileNotFoundError:
+            existing = set()
+        for subdir in required - existing:
             (self.data_dir / subdir).mkdir(parents=True, exist_ok=True)
     
+    @property
+    def llm_config(self) -> LLMConfig:
+        """Parsed LLM configuration, loaded from YAML on first access."""
+        if self._llm_config is None:
+            self._llm_config = self._load_llm_config()
+        return self._llm_config
+
     def _load_llm_config(self) -> LLMConfig:
         """Load LLM configuration from YAML file."""
         config_path = self.config_dir / "llm_config.yaml"
         
         with open(config_path, 'r', encoding='utf-8') as f:
-            config_data = yaml.safe_load(f)
+            config_data = yaml.load(f, Loader=_YamlLoader)
         
         return LLMConfig(**config_data)
     
@@ -70,30 +129,15 @@ class OSCARSettings:
     
     def get_api_key(self, provider: str) -> str:
         """Get API key for the specified provider from environment variables."""
-        env_vars = {
-            "groq": "GROQ_API_KEY",
-            "openai": "OPENAI_API_KEY",
-            "gemini": "GEMINI_API_KEY"
-        }
-        
-        env_var = env_vars.get(provider.lower())
+        env_var = _API_KEY_ENV_VARS.get(provider.lower())
         if not env_var:
             raise ValueError(f"Unknown provider: {provider}")
-        
-        api_key = os.getenv(env_var)
-        if not api_key:
-            raise ValueError(f"API key not found for {provider}. Please set {env_var} in your .env file")
-        
-        return api_key
-    
+
+        return _env_api_key(provider, env_var)
+
     def get_tavily_keys(self) -> list:
         """Get Tavily API keys for web search with fallback support."""
-        keys = []
-        for key_name in ["TAVILY_API_KEY1", "TAVILY_API_KEY2"]:
-            key = os.getenv(key_name)
-            if key:
-                keys.append(key)
-        return keys
+        return list(_tavily_keys())
     
     # Simple property getters
     @property
@@ -112,13 +156,17 @@ class OSCARSettings:
     def dry_run_mode(self) -> bool:
         return os.getenv("OSCAR_DRY_RUN", "false").lower() == "true"
 
+    @property
+    def quiet_mode(self) -> bool:
+        return os.getenv("OSCAR_QUIET", "false").lower() == "true"
+
 
 # Global settings instance
 settings = OSCARSettings()
 
 # Centralized safety patterns (used by all components)
 SAFETY_PATTERNS = {
-    "dangerous_commands": [
+    "dangerous_commands": (
         r"\brm\s+-rf\s+/.*",               # Remove root dir
         r"\bdel\s+/s\s+/q\b",              # Windows delete
         r"\bformat\s+c:\b",                # Format drive
@@ -127,11 +175,30 @@ SAFETY_PATTERNS = {
         r"\bsudo\s+rm\s+-rf\s+/.*",        # Sudo rm -rf /
         r"\bdiskpart\b",                   # Diskpart tool
         r"\bfdisk\b"                       # fdisk tool
-    ],
-    "high_risk_keywords": [
+    ),
+    "high_risk_keywords": (
         "shutdown", "reboot", "mkfs", "chmod 777", "chown root"
-    ],
-    "medium_risk_keywords": [
+    ),
+    "medium_risk_keywords": (
         "kill", "service stop", "systemctl stop", "rmdir", "mv /"
-    ]
-}
\ No newline at end of file
+    ),
+}
+
+# All dangerous-command patterns fused into one compiled alternation: a
+# single scan of the input instead of one regex pass per pattern. Shared
+# by the safety callback and the shell tool.
+DANGEROUS_COMMAND_RE = re.compile(
+    "|".join(f"(?:{p})" for p in SAFETY_PATTERNS["dangerous_commands"]),
+    re.IGNORECASE,
+)
+
+# Keyword tiers as single alternations over escaped literals — one scan of
+# the (already lowercased) input instead of a substring pass per keyword.
+# With sets this small a dedicated Aho-Corasick dependency isn't worth it;
+# re's alternation gives the same single-pass behavior.
+HIGH_RISK_KEYWORD_RE = re.compile(
+    "|".join(re.escape(k) for k in SAFETY_PATTERNS["high_risk_keywords"])
+)
+MEDIUM_RISK_KEYWORD_RE = re.compile(
+    "|".join(re.escape(k) for k in SAFETY_PATTERNS["medium_risk_keywords"])
+)
\ No newline at end of file
@@ -9,13 +9,16 @@ Usage:
     response = get_agent().chat("compare main and dev")
 """
 
+import atexit
 import json
 import platform
+import queue
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, List
 
-from rich.console import Console
+from rich import get_console
 
 # Apply Asterix patches (idempotent — adds Gemini/Vertex AI support)
 import oscar.core.asterix_patch  # noqa: F401
@@ -37,7 +40,24 @@ from oscar.tools.browser import (
     browser_navigate, browser_search, browser_extract, browser_download,
 )
 
-console = Console()
+# Use Rich's process-wide console so agent, safety prompts, and CLI output
+# share one instance (and one terminal-state detection) instead of each
+# module constructing its own.
+console = get_console()
+
+# orjson serializes ~5-10x faster than stdlib json; fall back silently
+# since audit logging must never become an install requirement.
+try:
+    import orjson
+
+    def _dumps_line(obj: dict) -> str:
+        return orjson.dumps(obj).decode("utf-8") + "\n"
+
+except ImportError:
+
+    def _dumps_line(obj: dict) -> str:
+        return json.dumps(obj) + "\n"
+
 
 # ---------------------------------------------------------------------------
 # Audit logging
@@ -46,17 +66,110 @@ console = Console()
 _audit_path = settings.data_dir / "logs" / "audit.jsonl"
 _audit_path.parent.mkdir(parents=True, exist_ok=True)
 
+# Audit entries go onto a bounded queue drained by a daemon worker thread,
+# so the agent loop never blocks on disk I/O. The worker batches whatever
+# is queued into a single append; atexit sends a sentinel and joins so
+# shutdown drains the queue. If the queue is full (disk stalled), entries
+# are dropped rather than stalling tool execution — same trade-off as the
+# previous best-effort try/except writer.
+_audit_queue: "queue.Queue[str]" = queue.Queue(maxsize=1000)
+_audit_thread = None
+
+# Rotate audit.jsonl once it passes this size; one previous generation is
+# kept as audit.jsonl.1 so tail scans stay fast without losing history.
+_AUDIT_MAX_BYTES = 10 * 1024 * 1024
+
+
+def _rotate_audit_log() -> bool:
+    """Cut audit.jsonl over to audit.jsonl.1 when it exceeds the cap.
+
+    Returns True if a rotation happened (the worker must reopen its handle).
+    """
+    try:
+        if _audit_path.stat().st_size < _AUDIT_MAX_BYTES:
+            return False
+    except OSError:  # not created yet
+        return False
+    try:
+        _audit_path.replace(_audit_path.with_name(_audit_path.name + ".1"))
+        return True
+    except OSError:
+        return False
+
+
+def _audit_worker() -> None:
+    """Drain the audit queue in batches until the shutdown sentinel arrives.
+
+    One append-mode handle (O_APPEND under the hood) stays open across
+    batches instead of an open/close per flush; it's cycled only when
+    rotation swaps the file out.
+    """
+    out = None
+    running = True
+    while running:
+        lines = [_audit_queue.get()]
+        try:
+            while True:
+                lines.append(_audit_queue.get_nowait())
+        except queue.Empty:
+            pass
+
+        if None in lines:
+            running = False
+            lines = [line for line in lines if line is not None]
+
+        if lines:
+            try:
+                if _rotate_audit_log() and out is not None:
+                    out.close()
+                    out = None
+                if out is None:
+                    out = open(_audit_path, "a", encoding="utf-8")
+                out.writelines(lines)
+                out.flush()
+            except Exception:
+                pass
+
+    if out is not None:
+        try:
+            out.close()
+        except Exception:
+            pass
+
+
+def _ensure_audit_worker() -> None:
+    """Start the audit worker thread on first use."""
+    global _audit_thread
+    if _audit_thread is None or not _audit_thread.is_alive():
+        _audit_thread = threading.Thread(
+            target=_audit_worker, name="oscar-audit", daemon=True
+        )
+        _audit_thread.start()
+
+
+def _shutdown_audit_worker() -> None:
+    """Signal the worker to drain and stop, waiting briefly for it."""
+    if _audit_thread is not None and _audit_thread.is_alive():
+        try:
+            _audit_queue.put_nowait(None)
+        except queue.Full:
+            return
+        _audit_thread.join(timeout=2.0)
+
+
+atexit.register(_shutdown_audit_worker)
+
 
 def _audit_log(tool_name: str, arguments: dict) -> None:
-    """Append tool call to JSONL audit trail."""
+    """Queue a tool call for the JSONL audit trail."""
     try:
         entry = {
             "timestamp": datetime.now().isoformat(),
             "tool": tool_name,
             "arguments": {k: str(v)[:200] for k, v in arguments.items()},
         }
-        with open(_audit_path, "a", encoding="utf-8") as f:
-            f.write(json.dumps(entry) + "\n")
+        _ensure_audit_worker()
+        _audit_queue.put_nowait(_dumps_line(entry))
     except Exception:
         pass
 
@@ -83,6 +196,16 @@ def get_last_step() -> Dict[str, Any]:
 # Monkey-patch Asterix Agent to support custom system prompt + callbacks
 # ---------------------------------------------------------------------------
 
+# Static tail of the system prompt — identical every turn, built once.
+_TOOL_CALLING_INSTRUCTIONS = "\n".join([
+    "# Tool Calling",
+    "You have access to function calling tools. When a tool is relevant:",
+    "- **Call the tool using function calling** — do not just describe what it would return.",
+    "- Use memory tools to persist important information across sessions.",
+    "",
+])
+
+
 def _patch_agent(agent: Agent, system_prompt: str) -> None:
     """Patch an Asterix v0.2.1 Agent with OSCAR-specific features.
 
@@ -95,9 +218,14 @@ def _patch_agent(agent: Agent, system_prompt: str) -> None:
     original_build = agent._build_system_prompt
 
     def patched_build_system_prompt() -> str:
-        """Replace generic prompt with OSCAR's GitHub-focused prompt."""
-        # Start with our custom prompt
-        lines = [system_prompt, ""]
+        """Replace generic prompt with OSCAR's GitHub-focused prompt.
+
+        Stable content (custom prompt + tool instructions) comes first and
+        volatile memory blocks last, so provider-side prompt caching
+        (e.g. Gemini implicit context caching) can reuse the shared prefix
+        across turns instead of missing on the first changed block.
+        """
+        lines = [system_prompt, "", _TOOL_CALLING_INSTRUCTIONS]
 
         # Append memory blocks (reuse original logic for block formatting)
         lines.append("# Memory Blocks")
@@ -110,14 +238,6 @@ def _patch_agent(agent: Agent, system_prompt: str) -> None:
             lines.append("```")
             lines.append("")
 
-        # Tool usage instructions
-        lines.extend([
-            "# Tool Calling",
-            "You have access to function calling tools. When a tool is relevant:",
-            "- **Call the tool using function calling** — do not just describe what it would return.",
-            "- Use memory tools to persist important information across sessions.",
-            "",
-        ])
         return "\n".join(lines)
 
     agent._build_system_prompt = patched_build_system_prompt
@@ -137,10 +257,25 @@ def _patch_agent(agent: Agent, system_prompt: str) -> None:
             except (json.JSONDecodeError, TypeError):
                 arguments = {}
 
+            # Dry-run: report what would execute, skip the safety prompt
+            # and the tool itself
+            if settings.dry_run_mode:
+                if not settings.quiet_mode:
+                    console.print(f"[cyan]  Dry-run: {tool_name}[/cyan]")
+                results.append({
+                    "tool_call_id": tool_id,
+                    "role": "tool",
+                    "name": tool_name,
+                    "content": f"[dry-run] {tool_name} was not executed (OSCAR_DRY_RUN is set).",
+                })
+                _audit_log(tool_name, {"_status": "dry_run", **arguments})
+                continue
+
             # Safety gate
             approved = on_before_tool_call(tool_name, arguments)
             if not approved:
-                console.print(f"[yellow]  Rejected: {tool_name}[/yellow]")
+                if not settings.quiet_mode:
+                    console.print(f"[yellow]  Rejected: {tool_name}[/yellow]")
                 results.append({
                     "tool_call_id": tool_id,
                     "role": "tool",
@@ -153,7 +288,8 @@ def _patch_agent(agent: Agent, system_prompt: str) -> None:
             # Execute via original registry
             try:
                 tool_result = agent._tool_registry.execute_tool(tool_name, **arguments)
-                console.print(f"[green]  Done: {tool_name}[/green]")
+                if not settings.quiet_mode:
+                    console.print(f"[green]  Done: {tool_name}[/green]")
 
                 results.append({
                     "tool_call_id": tool_id,
@@ -238,8 +374,9 @@ def _create_agent() -> Agent:
     agent.tool(name="browser_extract", description="Extract content from the currently loaded page")(browser_extract)
     agent.tool(name="browser_download", description="Download a file from a URL")(browser_download)
 
-    tool_count = len(agent.get_all_tools())
-    console.print(f"[dim]OSCAR agent initialized — {tool_count} tools (Asterix + Gemini 2.5 Flash via Vertex AI)[/dim]")
+    if not settings.quiet_mode:
+        tool_count = len(agent.get_all_tools())
+        console.print(f"[dim]OSCAR agent initialized — {tool_count} tools (Asterix + Gemini 2.5 Flash via Vertex AI)[/dim]")
     return agent
 
 
@@ -0,0 +1,88 @@
+"""
+OSCAR Response Cache — opt-in, in-memory cache for agent chat responses.
+
+Exact-match on a SHA256 digest of (model, temperature, normalized prompt).
+Chat answers depend on live repository state, so the cache is disabled by
+default and only used when OSCAR_RESPONSE_CACHE=true.
+"""
+
+import hashlib
+import os
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+
+class ResponseCache:
+    """In-memory exact-match cache for chat responses.
+
+    Entries expire after ttl_seconds and the cache holds at most
+    max_entries, evicting least-recently-used first, so RAM stays bounded
+    in long-lived sessions.
+    """
+
+    def __init__(self, max_entries: int = 128, ttl_seconds: float = 900.0):
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+
+    @staticmethod
+    def _key(prompt: str, model: str = "", temperature: float = 0.0) -> str:
+        """Deterministic key: SHA256 over model, temperature, and prompt.
+
+        The prompt is normalized (casefolded, whitespace-collapsed) so
+        trivial variants hit; hashing keeps keys fixed-size regardless of
+        prompt length and makes them safe to persist or log.
+        """
+        normalized = " ".join(prompt.casefold().split())
+        material = f"{model}\x00{temperature}\x00{normalized}"
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def get(
+        self,
+        prompt: str,
+        model: str = "",
+        temperature: float = 0.0,
+        bypass: bool = False,
+    ) -> Optional[str]:
+        """Return the cached response for an equivalent prompt, or None.
+
+        Expired entries are pruned on access; hits are refreshed in LRU
+        order. bypass=True forces a miss (callers can demand a fresh
+        answer while leaving the cache populated for later hits).
+        """
+        if bypass:
+            return None
+
+        key = self._key(prompt, model, temperature)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, response = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return response
+
+    def put(self, prompt: str, response: str, model: str = "", temperature: float = 0.0) -> None:
+        """Store a response under the prompt's digest, evicting LRU overflow."""
+        key = self._key(prompt, model, temperature)
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        self._entries.clear()
+
+
+# Shared instance (mirrors the settings-singleton pattern); TTL and size
+# are tunable via env without code changes.
+response_cache = ResponseCache(
+    max_entries=int(os.getenv("OSCAR_RESPONSE_CACHE_SIZE", "128")),
+    ttl_seconds=float(os.getenv("OSCAR_RESPONSE_CACHE_TTL", "900")),
+)
@@ -5,19 +5,18 @@ Assesses tool call risk and prompts for user confirmation when needed.
 Low risk auto-approves; medium/high prompt yes/no; dangerous requires typing CONFIRM.
 """
 
-import re
-from rich.console import Console
-from rich.prompt import Confirm, Prompt
+from oscar.config.settings import (
+    DANGEROUS_COMMAND_RE,
+    HIGH_RISK_KEYWORD_RE,
+    MEDIUM_RISK_KEYWORD_RE,
+)
 
-from oscar.config.settings import SAFETY_PATTERNS
-
-console = Console()
-
-# Risk priority for comparisons
-_RISK_PRIORITY = {"low": 0, "medium": 1, "high": 2, "dangerous": 3}
+# rich.prompt is imported lazily in on_before_tool_call — the callback is
+# on the path of every tool call, but Confirm/Prompt are only needed for
+# the rare medium+ risk confirmations.
 
 # Tools that are inherently medium risk regardless of arguments
-_MEDIUM_RISK_TOOLS = {"git_push", "git_checkout", "git_commit"}
+_MEDIUM_RISK_TOOLS = frozenset({"git_push", "git_checkout", "git_commit"})
 
 
 def _extract_strings(obj) -> str:
@@ -58,23 +57,18 @@ def _assess_risk(tool_name: str, check_string: str) -> str:
 
     # Only apply pattern checks for shell commands or medium+ tools
     if tool_name == "run_shell_command" or risk != "low":
-        # Check dangerous command regexes (highest priority — return immediately)
-        for pattern in SAFETY_PATTERNS["dangerous_commands"]:
-            if re.search(pattern, check_string, re.IGNORECASE):
-                return "dangerous"
+        # Check dangerous command patterns (highest priority — return immediately)
+        if DANGEROUS_COMMAND_RE.search(check_string):
+            return "dangerous"
 
-        # Check high risk keywords
+        # Keyword checks, highest tier first — a high hit can't be
+        # outranked, so return immediately; the medium scan only matters
+        # when nothing has raised the risk yet.
         check_lower = check_string.lower()
-        for keyword in SAFETY_PATTERNS["high_risk_keywords"]:
-            if keyword in check_lower:
-                if _RISK_PRIORITY["high"] > _RISK_PRIORITY[risk]:
-                    risk = "high"
-
-        # Check medium risk keywords
-        for keyword in SAFETY_PATTERNS["medium_risk_keywords"]:
-            if keyword in check_lower:
-                if _RISK_PRIORITY["medium"] > _RISK_PRIORITY[risk]:
-                    risk = "medium"
+        if HIGH_RISK_KEYWORD_RE.search(check_lower):
+            return "high"
+        if risk == "low" and MEDIUM_RISK_KEYWORD_RE.search(check_lower):
+            risk = "medium"
 
     return risk
 
@@ -91,13 +85,22 @@ def on_before_tool_call(tool_name: str, arguments: dict) -> bool:
     Returns:
         True to allow the tool call, False to reject it.
     """
+    # Fast path: _assess_risk only applies pattern checks to shell commands
+    # and inherently medium-risk tools, so anything else is always low risk
+    # — skip string extraction and summarization entirely.
+    if tool_name != "run_shell_command" and tool_name not in _MEDIUM_RISK_TOOLS:
+        return True
+
     check_string = tool_name + " " + _extract_strings(arguments)
     risk = _assess_risk(tool_name, check_string)
-    summary = _summarize_args(arguments)
 
     if risk == "low":
         return True
 
+    summary = _summarize_args(arguments)
+
+    from rich.prompt import Confirm, Prompt
+
     if risk == "medium":
         return Confirm.ask(
             f"[yellow]Warning — Medium risk:[/yellow] {tool_name}({summary}). Allow?",
@@ -9,19 +9,18 @@ Functions:
 """
 
 from pathlib import Path
-from typing import Dict, List
-
-import requests
-from bs4 import BeautifulSoup
+from typing import TYPE_CHECKING, Dict, List
 
 from oscar.config.settings import settings
 
-try:
-    from playwright.sync_api import sync_playwright, Browser, Page
+if TYPE_CHECKING:
+    # Browser/Page are only referenced in (string) annotations — keep them
+    # out of the runtime import so they don't cost anything at module load.
+    from playwright.sync_api import Browser, Page
 
-    PLAYWRIGHT_AVAILABLE = True
-except ImportError:
-    PLAYWRIGHT_AVAILABLE = False
+# playwright, requests, and bs4 are imported lazily inside the functions
+# that use them: registering the browser tools on the agent must not pay
+# for Playwright's (or requests') import cost on cold start.
 
 
 # ---------------------------------------------------------------------------
@@ -38,6 +37,20 @@ _download_dir.mkdir(exist_ok=True)
 
 _MAX_CONTENT_LENGTH = 5000
 
+# Shared HTTP session for downloads — keeps connections pooled across
+# calls instead of a fresh TCP/TLS handshake per file.
+_http_session = None
+
+
+def _get_http_session():
+    """Lazily create the shared requests session."""
+    global _http_session
+    if _http_session is None:
+        import requests
+
+        _http_session = requests.Session()
+    return _http_session
+
 
 # ---------------------------------------------------------------------------
 # Private helpers
@@ -51,7 +64,9 @@ def _ensure_browser() -> "Page":
     if _page is not None:
         return _page
 
-    if not PLAYWRIGHT_AVAILABLE:
+    try:
+        from playwright.sync_api import sync_playwright
+    except ImportError:
         raise RuntimeError(
             "Playwright not available. Install with: pip install playwright && playwright install chromium"
         )
@@ -75,6 +90,8 @@ def _get_page_content() -> str:
     if _page is None:
         return ""
     try:
+        from bs4 import BeautifulSoup
+
         html = _page.content()
         soup = BeautifulSoup(html, "html.parser")
 
@@ -244,7 +261,7 @@ def browser_download(url: str) -> str:
         return "Error: URL must start with http:// or https://"
 
     try:
-        response = requests.get(url, stream=True, timeout=60)
+        response = _get_http_session().get(url, stream=True, timeout=60)
         response.raise_for_status()
 
         filename = url.split("/")[-1].split("?")[0] or "download"
@@ -7,19 +7,18 @@ regex checks, and cross-platform translation from the original ShellTool class.
 
 import subprocess
 import shlex
-import re
 import platform
 
-from oscar.config.settings import SAFETY_PATTERNS
+from oscar.config.settings import DANGEROUS_COMMAND_RE, HIGH_RISK_KEYWORD_RE
 
 
 _IS_WINDOWS = platform.system() == "Windows"
 
-SAFE_COMMANDS = {
+SAFE_COMMANDS = frozenset({
     "ls", "dir", "pwd", "cd", "mkdir", "echo", "cat", "type",
     "python", "pip", "git", "node", "npm", "curl", "wget",
     "tree", "whoami", "date", "which", "where",
-}
+})
 
 _COMMAND_TRANSLATIONS = {
     "ls": "dir" if _IS_WINDOWS else "ls",
@@ -33,18 +32,17 @@ def _validate_command(command: str) -> str | None:
     """Return an error message if the command is unsafe, or None if OK."""
     command_lower = command.lower().strip()
 
-    for pattern in SAFETY_PATTERNS["dangerous_commands"]:
-        if re.search(pattern, command, re.IGNORECASE):
-            return "Dangerous pattern detected"
+    if DANGEROUS_COMMAND_RE.search(command):
+        return "Dangerous pattern detected"
 
     base_command = command_lower.split()[0] if command_lower.split() else ""
 
     if base_command in SAFE_COMMANDS:
         return None
 
-    for keyword in SAFETY_PATTERNS["high_risk_keywords"]:
-        if keyword in command_lower:
-            return f"High-risk operation detected: {keyword}"
+    match = HIGH_RISK_KEYWORD_RE.search(command_lower)
+    if match:
+        return f"High-risk operation detected: {match.group(0)}"
 
     return None
 
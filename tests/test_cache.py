@@ -0,0 +1,59 @@
+"""Tests for the opt-in response cache."""
+
+from oscar.core.cache import ResponseCache
+
+
+def test_exact_match_roundtrip():
+    cache = ResponseCache()
+    cache.put("show git status", "clean tree")
+    assert cache.get("show git status") == "clean tree"
+
+
+def test_normalized_variants_hit():
+    cache = ResponseCache()
+    cache.put("Show Git Status", "clean tree")
+    assert cache.get("  show   git status ") == "clean tree"
+
+
+def test_miss_returns_none():
+    cache = ResponseCache()
+    assert cache.get("compare main and dev") is None
+
+
+def test_key_separates_model_and_temperature():
+    cache = ResponseCache()
+    cache.put("show git status", "from gemini", model="gemini-2.5-flash")
+    assert cache.get("show git status", model="gemini-2.5-flash") == "from gemini"
+    assert cache.get("show git status", model="llama-3.3-70b") is None
+    assert cache.get("show git status", model="gemini-2.5-flash", temperature=0.7) is None
+
+
+def test_clear():
+    cache = ResponseCache()
+    cache.put("a", "b")
+    cache.clear()
+    assert cache.get("a") is None
+
+
+def test_bypass_forces_miss_without_evicting():
+    cache = ResponseCache()
+    cache.put("a", "b")
+    assert cache.get("a", bypass=True) is None
+    assert cache.get("a") == "b"
+
+
+def test_ttl_expiry():
+    cache = ResponseCache(ttl_seconds=0)
+    cache.put("a", "b")
+    assert cache.get("a") is None
+
+
+def test_lru_eviction_cap():
+    cache = ResponseCache(max_entries=2)
+    cache.put("one", "1")
+    cache.put("two", "2")
+    cache.get("one")  # refresh "one" so "two" is the LRU entry
+    cache.put("three", "3")
+    assert cache.get("one") == "1"
+    assert cache.get("two") is None
+    assert cache.get("three") == "3"
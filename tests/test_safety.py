@@ -0,0 +1,33 @@
+"""Tests for safety risk assessment and shell command validation."""
+
+from oscar.core.safety import _assess_risk
+from oscar.tools.shell import _validate_command
+
+
+def test_dangerous_command_detected():
+    assert _assess_risk("run_shell_command", "run_shell_command rm -rf /home") == "dangerous"
+    assert _assess_risk("run_shell_command", "run_shell_command sudo rm -rf /etc") == "dangerous"
+
+
+def test_high_risk_keyword_detected():
+    assert _assess_risk("run_shell_command", "run_shell_command shutdown now") == "high"
+
+
+def test_medium_risk_tools():
+    assert _assess_risk("git_push", "git_push origin main") == "medium"
+    assert _assess_risk("git_checkout", "git_checkout dev") == "medium"
+
+
+def test_low_risk_default():
+    assert _assess_risk("git_status", "git_status") == "low"
+    assert _assess_risk("web_search", "web_search python asyncio") == "low"
+
+
+def test_shell_validation_blocks_dangerous():
+    assert _validate_command("rm -rf / --no-preserve-root") is not None
+    assert _validate_command("dd if=/dev/zero of=/dev/sda") is not None
+
+
+def test_shell_validation_allows_safe():
+    assert _validate_command("ls -la") is None
+    assert _validate_command("git status") is None
@@ -0,0 +1,57 @@
+"""
+Regression tests for CLI cold-start imports.
+
+Importing `oscar.cli.main` must stay cheap: Rich and the heavy agent stack
+are loaded lazily inside command handlers, so `oscar --help` doesn't pay
+for them. Each test imports the module in a fresh interpreter and inspects
+sys.modules, so results aren't polluted by this test process.
+"""
+
+import json
+import subprocess
+import sys
+
+
+def _modules_after_cli_import() -> set:
+    """Import oscar.cli.main in a subprocess and return sys.modules keys."""
+    out = subprocess.check_output(
+        [
+            sys.executable,
+            "-c",
+            "import oscar.cli.main, json, sys; json.dump(sorted(sys.modules), sys.stdout)",
+        ],
+        text=True,
+    )
+    return set(json.loads(out))
+
+
+def test_rich_not_imported_at_module_scope():
+    mods = _modules_after_cli_import()
+    assert not any(m == "rich" or m.startswith("rich.") for m in mods)
+
+
+def test_agent_stack_not_imported_at_module_scope():
+    """The LLM SDK and agent layer load only inside command handlers."""
+    mods = _modules_after_cli_import()
+    assert "groq" not in mods
+    assert "oscar.core.agent" not in mods
+    assert "asterix" not in mods
+
+
+def test_click_not_imported_at_module_scope():
+    """Click is only needed for --help; the fast path parses argv by hand."""
+    mods = _modules_after_cli_import()
+    assert "click" not in mods
+
+
+def test_startup_import_budget():
+    """Total module count stays within budget.
+
+    A bare interpreter loads ~100 modules; importing oscar.cli.main
+    currently adds fewer than 10. The ceiling leaves headroom for stdlib
+    drift across Python versions while still catching an accidental
+    top-level import of rich/click/the agent stack (each adds dozens).
+    Profile regressions locally with:
+    python -X importtime -c "import oscar.cli.main"
+    """
+    assert len(_modules_after_cli_import()) < 160